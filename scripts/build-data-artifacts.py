@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Build content-hashed, pre-compressed data artifacts for edge caching.
+
+Writes each generated data set (element table, indexes, lookup tables,
+periodic table layout, flashcard decks and locale chunks) to
+public/data/immutable/<name>.<hash>.json, with gzip and brotli variants
+under the same name in immutable/gz/ and immutable/br/.
+public/data/manifest.json maps artifact names to their current files, and
+the app loads artifacts through it (src/utils/data-artifacts.ts) instead of
+bundling them. Vite copies public/ into dist/, and public/_headers marks the
+hashed files as immutable and sets Content-Encoding on the gz/ and br/
+variants, so a data-only change downloads just the artifacts whose content
+changed.
+
+Brotli output needs the packages in scripts/requirements.txt. The script
+fails without them unless --no-brotli is passed.
+
+Run from the repository root after changing the data files, then commit
+public/data/:
+    pip install -r scripts/requirements.txt
+    python3 scripts/build-data-artifacts.py
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+from element_data import load_elements
+from flashcard_decks import build_decks
+from periodic_layout import COLOR_BINS, TRENDS, grid_position, trend_color, trend_scale
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+OUTPUT_DIR = 'public/data'
+IMMUTABLE_DIR = 'immutable'
+# Manifest key -> subdirectory holding that encoding's variants
+VARIANT_DIRS = {'gzip': 'gz', 'br': 'br'}
+HASH_LENGTH = 16
+
+
+def to_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def element_table(elements):
+    # Localized names ship separately in the locale chunks
+    return [{key: value for key, value in el.items() if key != 'alternativeNames'} for el in elements]
+
+
+def element_indexes(elements):
+    indexes = {'bySymbol': {}, 'byCategory': {}, 'byGroup': {}, 'byPeriod': {}}
+    for el in elements:
+        number = el['atomicNumber']
+        indexes['bySymbol'][el['symbol']] = number
+        indexes['byCategory'].setdefault(el['category'], []).append(number)
+        if el['group'] is not None:
+            indexes['byGroup'].setdefault(str(el['group']), []).append(number)
+        indexes['byPeriod'].setdefault(str(el['period']), []).append(number)
+    return indexes
+
+
+def atomic_masses(elements):
+    return {el['symbol']: el['atomicMass'] for el in elements}
+
+
+def periodic_layout(elements):
+    trends = {}
+    for trend, prop in TRENDS.items():
+        low, high, normalized, bins = trend_scale(elements, prop)
+        trends[trend] = {'property': prop, 'min': low, 'max': high, 'normalized': normalized, 'bins': bins}
+    return {
+        'positions': {str(el['atomicNumber']): list(grid_position(el)) for el in elements},
+        'colorBins': [trend_color(i / (COLOR_BINS - 1)) for i in range(COLOR_BINS)],
+        'trends': trends,
+    }
+
+
+def locale_chunks(elements):
+    chunks = {}
+    for el in elements:
+        for locale, name in el.get('alternativeNames', {}).items():
+            chunks.setdefault(locale, {})[str(el['atomicNumber'])] = name
+    return chunks
+
+
+def build_artifacts(elements):
+    artifacts = {
+        'elements': element_table(elements),
+        'element-index': element_indexes(elements),
+        'atomic-masses': atomic_masses(elements),
+        'periodic-layout': periodic_layout(elements),
+    }
+
+    # A small index of the decks, then one artifact per deck so the app only
+    # downloads the deck being studied
+    decks = build_decks(elements)
+    artifacts['flashcards'] = [
+        {'id': deck_id, 'label': label, 'artifact': f'flashcards-{deck_id}', 'cardCount': len(cards)}
+        for deck_id, label, cards in decks
+    ]
+    for deck_id, _, cards in decks:
+        artifacts[f'flashcards-{deck_id}'] = [list(card) for card in cards]
+
+    for locale, names in sorted(locale_chunks(elements).items()):
+        artifacts[f'names-{locale}'] = names
+    return artifacts
+
+
+def write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+# Write one artifact and its compressed variants, returning its manifest entry
+def write_artifact(name, data, use_brotli):
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    filename = f'{name}.{digest}.json'
+
+    variants = {
+        # mtime=0 keeps the gzip output identical for identical content
+        'gzip': gzip.compress(data, compresslevel=9, mtime=0),
+    }
+    if use_brotli:
+        variants['br'] = brotli.compress(data, quality=11)
+
+    path = f'{IMMUTABLE_DIR}/{filename}'
+    write_file(os.path.join(OUTPUT_DIR, path), data)
+    entry = {'path': path, 'hash': digest, 'bytes': len(data)}
+
+    for encoding, compressed in variants.items():
+        path = f'{IMMUTABLE_DIR}/{VARIANT_DIRS[encoding]}/{filename}'
+        write_file(os.path.join(OUTPUT_DIR, path), compressed)
+        entry[encoding] = {'path': path, 'bytes': len(compressed)}
+
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build content-hashed data artifacts')
+    parser.add_argument('--no-brotli', action='store_true', help='Skip the .br variants (not for deploys)')
+    args = parser.parse_args()
+
+    if brotli is None and not args.no_brotli:
+        sys.exit('brotli is not installed: run pip install -r scripts/requirements.txt (or pass --no-brotli)')
+
+    elements = sorted(load_elements(), key=lambda el: el['atomicNumber'])
+    artifacts = build_artifacts(elements)
+
+    directories = [IMMUTABLE_DIR] + [f'{IMMUTABLE_DIR}/{d}' for d in VARIANT_DIRS.values()]
+    for directory in directories:
+        os.makedirs(os.path.join(OUTPUT_DIR, directory), exist_ok=True)
+
+    manifest = {'artifacts': {}}
+    for name, content in artifacts.items():
+        manifest['artifacts'][name] = write_artifact(name, to_json(content), not args.no_brotli)
+
+    # Remove artifacts from previous builds that are no longer referenced
+    current = set()
+    for entry in manifest['artifacts'].values():
+        current.add(entry['path'])
+        current.update(entry[encoding]['path'] for encoding in VARIANT_DIRS if encoding in entry)
+    for directory in directories:
+        for filename in os.listdir(os.path.join(OUTPUT_DIR, directory)):
+            path = f'{directory}/{filename}'
+            if path not in current and os.path.isfile(os.path.join(OUTPUT_DIR, path)):
+                os.remove(os.path.join(OUTPUT_DIR, path))
+
+    with open(os.path.join(OUTPUT_DIR, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+    for name, entry in manifest['artifacts'].items():
+        sizes = f"{entry['bytes']} B, gzip {entry['gzip']['bytes']} B"
+        if 'br' in entry:
+            sizes += f", br {entry['br']['bytes']} B"
+        print(f"  {entry['path']} ({sizes})")
+    print(f"Wrote {len(artifacts)} artifacts and manifest to {OUTPUT_DIR}")
+    if args.no_brotli:
+        print('Warning: built without brotli variants; do not deploy this output')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Load test for scripts/calc-service.py using only the standard library.
+
+Opens several keep-alive connections to the local service, fires a mix of
+calculation requests, and reports client-side throughput and latency
+followed by the service's own /stats counters.
+
+Usage (with the service already running):
+    python3 scripts/calc-loadtest.py --port 8787 --connections 64 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+HOST = '127.0.0.1'
+
+FORMULAS = ['H2O', 'CO2', 'NaCl', 'C6H12O6', 'H2SO4', 'CaCO3', 'NH3', 'CH4', 'C2H5OH', 'Fe2O3']
+
+
+# A small pool of inputs so repeated requests exercise the cache
+def random_request(rng, distinct):
+    value = rng.randint(1, distinct)
+    op = rng.choice(['molarMass', 'molesToMass', 'massToMoles', 'molesToParticles', 'pH', 'idealGas', 'specificHeat'])
+    if op == 'molarMass':
+        return {'op': op, 'formula': f'{rng.choice(FORMULAS)}{value}'}
+    if op == 'molesToMass':
+        return {'op': op, 'moles': value / 10, 'molarMass': 18.015}
+    if op == 'massToMoles':
+        return {'op': op, 'mass': value, 'molarMass': 44.01}
+    if op == 'molesToParticles':
+        return {'op': op, 'moles': value / 100}
+    if op == 'pH':
+        return {'op': op, 'hConcentration': 10 ** -(value % 14 + 1)}
+    if op == 'idealGas':
+        return {'op': op, 'volume': 22.4, 'moles': value / 10, 'temperature': 273.15}
+    return {'op': op, 'mass': value, 'specificHeat': 4.184, 'temperatureChange': 10}
+
+
+async def send(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write(
+        f'{method} {path} HTTP/1.1\r\n'
+        f'Host: {HOST}\r\n'
+        f'Content-Type: application/json\r\n'
+        f'Content-Length: {len(body)}\r\n\r\n'.encode('latin-1') + body
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def worker(port, count, distinct, seed, latencies):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(HOST, port)
+    failures = 0
+    try:
+        for _ in range(count):
+            started = time.perf_counter()
+            status, result = await send(reader, writer, 'POST', '/calculate', random_request(rng, distinct))
+            latencies.append(time.perf_counter() - started)
+            if status != 200 or not result['success']:
+                failures += 1
+    finally:
+        writer.close()
+    return failures
+
+
+async def run(port, connections, requests, distinct):
+    latencies = []
+    started = time.perf_counter()
+    failures = await asyncio.gather(*(
+        worker(port, requests, distinct, seed, latencies) for seed in range(connections)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+    print(f'Requests:    {len(latencies)} over {connections} connections')
+    print(f'Failures:    {sum(failures)}')
+    print(f'Elapsed:     {elapsed:.2f} s')
+    print(f'Throughput:  {len(latencies) / elapsed:.0f} req/s')
+    print(f'Latency ms:  p50 {percentile(0.50):.2f}  p95 {percentile(0.95):.2f}  p99 {percentile(0.99):.2f}')
+
+    reader, writer = await asyncio.open_connection(HOST, port)
+    _, stats = await send(reader, writer, 'GET', '/stats')
+    writer.close()
+    print('Service stats:')
+    print(json.dumps(stats, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the local calculation service')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--connections', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=200, help='Requests per connection')
+    parser.add_argument('--distinct', type=int, default=50, help='Distinct values per operation')
+    args = parser.parse_args()
+
+    asyncio.run(run(args.port, args.connections, args.requests, args.distinct))
+
+
+if __name__ == '__main__':
+    main()
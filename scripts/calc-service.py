@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+"""
+Local calculation service for back-office tools.
+
+Serves the same answers as src/utils/calculations.ts and
+src/utils/chemical-formulas.ts over HTTP on localhost. Concurrent requests
+are coalesced into per-operation batches, and repeated inputs are answered
+from an LRU cache.
+
+Usage (from the repository root):
+    python3 scripts/calc-service.py --port 8787
+
+    POST /calculate  {"op": "molarMass", "formula": "H2O"}
+                     or a JSON list of such objects
+    GET  /stats      latency, throughput (last 10 s), batching and cache counters
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import re
+import sys
+import time
+import traceback
+from collections import OrderedDict, deque
+
+from element_data import elements_by_symbol, load_elements
+
+# The service only ever listens on the loopback interface
+HOST = '127.0.0.1'
+
+# Largest request body accepted; a batch of a few thousand requests fits easily
+MAX_BODY_BYTES = 1024 * 1024
+
+AVOGADRO_NUMBER = 6.022e23
+GAS_CONSTANT = 0.0821  # L·atm/(mol·K)
+
+
+def ok(data):
+    return {'success': True, 'data': data}
+
+
+def fail(error):
+    return {'success': False, 'error': error}
+
+
+# Coerce a JSON number to float, as JavaScript numbers are
+def to_number(name, value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f'{name} must be a number')
+    try:
+        number = float(value)
+    except OverflowError:
+        raise ValueError(f'{name} is out of range')
+    if not math.isfinite(number):
+        raise ValueError(f'{name} is out of range')
+    return number
+
+
+# Pull the named numeric parameters out of a request, None when absent
+def numeric_params(params, names):
+    values = {}
+    for name in names:
+        value = params.get(name)
+        values[name] = None if value is None else to_number(name, value)
+    return values
+
+
+# Same tokenizer as parseFormula in chemical-formulas.ts
+def parse_formula(formula):
+    if not isinstance(formula, str) or formula.strip() == '':
+        return fail('Formula cannot be empty')
+
+    parts = []
+    i = 0
+    while i < len(formula):
+        if re.match(r'[\s+→=]', formula[i]):
+            i += 1
+            continue
+
+        if not re.match(r'[A-Z]', formula[i]):
+            return fail(f'Invalid formula: expected element at position {i}')
+
+        element = formula[i]
+        i += 1
+        if i < len(formula) and re.match(r'[a-z]', formula[i]):
+            element += formula[i]
+            i += 1
+
+        count_str = ''
+        while i < len(formula) and formula[i] in '0123456789':
+            count_str += formula[i]
+            i += 1
+
+        count = 1 if count_str == '' else int(count_str)
+        if count < 1:
+            return fail(f'Invalid count for element {element}')
+
+        parts.append({'element': element, 'count': count})
+
+    return ok(parts)
+
+
+def make_molar_mass(atomic_masses):
+    def molar_mass(params):
+        parsed = parse_formula(params.get('formula'))
+        if not parsed['success']:
+            return parsed
+
+        breakdown = []
+        total_mass = 0
+        for part in parsed['data']:
+            atomic_mass = atomic_masses.get(part['element'])
+            if atomic_mass is None:
+                return fail(f"Unknown element: {part['element']}")
+            mass = part['count'] * atomic_mass
+            total_mass += mass
+            breakdown.append({'element': part['element'], 'count': part['count'], 'mass': mass})
+
+        return ok({'molarMass': total_mass, 'breakdown': breakdown})
+
+    return molar_mass
+
+
+def moles_to_mass(params):
+    p = numeric_params(params, ['moles', 'molarMass'])
+    if p['moles'] is None or p['molarMass'] is None:
+        return fail('moles and molarMass are required')
+    if p['molarMass'] <= 0:
+        return fail('Molar mass must be positive')
+    return ok(p['moles'] * p['molarMass'])
+
+
+def mass_to_moles(params):
+    p = numeric_params(params, ['mass', 'molarMass'])
+    if p['mass'] is None or p['molarMass'] is None:
+        return fail('mass and molarMass are required')
+    if p['molarMass'] <= 0:
+        return fail('Molar mass must be positive')
+    return ok(p['mass'] / p['molarMass'])
+
+
+def moles_to_particles(params):
+    p = numeric_params(params, ['moles'])
+    if p['moles'] is None:
+        return fail('moles is required')
+    return ok(p['moles'] * AVOGADRO_NUMBER)
+
+
+def particles_to_moles(params):
+    p = numeric_params(params, ['particles'])
+    if p['particles'] is None:
+        return fail('particles is required')
+    if p['particles'] < 0:
+        return fail('Particle count cannot be negative')
+    return ok(p['particles'] / AVOGADRO_NUMBER)
+
+
+# Mirrors calculatePH: pH, then pOH, then [H+], then [OH-] take precedence
+def calculate_ph(params):
+    p = numeric_params(params, ['hConcentration', 'ohConcentration', 'pH', 'pOH'])
+
+    if p['pH'] is not None:
+        ph = p['pH']
+        poh = 14 - ph
+        h, oh = 10 ** -ph, 10 ** -poh
+    elif p['pOH'] is not None:
+        poh = p['pOH']
+        ph = 14 - poh
+        h, oh = 10 ** -ph, 10 ** -poh
+    elif p['hConcentration'] is not None:
+        if p['hConcentration'] <= 0:
+            return fail('H+ concentration must be positive')
+        h = p['hConcentration']
+        ph = -math.log10(h)
+        poh = 14 - ph
+        oh = 10 ** -poh
+    elif p['ohConcentration'] is not None:
+        if p['ohConcentration'] <= 0:
+            return fail('OH- concentration must be positive')
+        oh = p['ohConcentration']
+        poh = -math.log10(oh)
+        ph = 14 - poh
+        h = 10 ** -ph
+    else:
+        return fail('At least one parameter must be provided')
+
+    return ok({'pH': ph, 'pOH': poh, 'hConcentration': h, 'ohConcentration': oh})
+
+
+# Mirrors idealGasLaw: solves PV = nRT for whichever variable is missing
+def ideal_gas_law(params):
+    p = numeric_params(params, ['pressure', 'volume', 'moles', 'temperature', 'gasConstant'])
+    r = p['gasConstant'] if p['gasConstant'] is not None else GAS_CONSTANT
+    pressure, volume, moles, temperature = p['pressure'], p['volume'], p['moles'], p['temperature']
+    known = sum(v is not None for v in (pressure, volume, moles, temperature))
+
+    if known < 3:
+        return fail('At least 3 variables must be provided')
+
+    try:
+        if known == 4:
+            if abs((moles * r * temperature) / volume - pressure) > 0.01:
+                return fail('Provided values do not satisfy PV = nRT')
+            unit = 'L·atm/(mol·K)'
+        elif pressure is None:
+            pressure = (moles * r * temperature) / volume
+            unit = 'atm'
+        elif volume is None:
+            volume = (moles * r * temperature) / pressure
+            unit = 'L'
+        elif moles is None:
+            moles = (pressure * volume) / (r * temperature)
+            unit = 'mol'
+        else:
+            temperature = (pressure * volume) / (r * moles)
+            unit = 'K'
+    except ZeroDivisionError:
+        return fail('Division by zero')
+
+    return ok({'pressure': pressure, 'volume': volume, 'moles': moles, 'temperature': temperature, 'unit': unit})
+
+
+# Mirrors specificHeatCalculation: q = mcΔT, including the worked steps
+def specific_heat(params):
+    p = numeric_params(params, ['mass', 'specificHeat', 'temperatureChange', 'heat'])
+    m, c, dt, q = p['mass'], p['specificHeat'], p['temperatureChange'], p['heat']
+    known = sum(v is not None for v in (m, c, dt, q))
+
+    if known < 3:
+        return fail('At least 3 variables must be provided')
+
+    try:
+        if q is None:
+            q = m * c * dt
+            steps = [
+                'q = m × c × ΔT',
+                f'q = {m:.2f} g × {c:.3f} J/(g·°C) × {dt:.2f} °C',
+                f'q = {q:.2f} J',
+            ]
+        elif m is None:
+            m = q / (c * dt)
+            steps = [
+                'm = q / (c × ΔT)',
+                f'm = {q:.2f} J / ({c:.3f} J/(g·°C) × {dt:.2f} °C)',
+                f'm = {m:.2f} g',
+            ]
+        elif c is None:
+            c = q / (m * dt)
+            steps = [
+                'c = q / (m × ΔT)',
+                f'c = {q:.2f} J / ({m:.2f} g × {dt:.2f} °C)',
+                f'c = {c:.3f} J/(g·°C)',
+            ]
+        else:
+            dt = q / (m * c)
+            steps = [
+                'ΔT = q / (m × c)',
+                f'ΔT = {q:.2f} J / ({m:.2f} g × {c:.3f} J/(g·°C))',
+                f'ΔT = {dt:.2f} °C',
+            ]
+    except ZeroDivisionError:
+        return fail('Division by zero')
+
+    return ok({'heat': q, 'steps': steps})
+
+
+def build_operations(elements):
+    atomic_masses = {symbol: el['atomicMass'] for symbol, el in elements_by_symbol(elements).items()}
+    return {
+        'molarMass': make_molar_mass(atomic_masses),
+        'molesToMass': moles_to_mass,
+        'massToMoles': mass_to_moles,
+        'molesToParticles': moles_to_particles,
+        'particlesToMoles': particles_to_moles,
+        'pH': calculate_ph,
+        'idealGas': ideal_gas_law,
+        'specificHeat': specific_heat,
+    }
+
+
+# Apply one operation to a whole batch of parameter sets. A bad input only
+# fails its own result, never the rest of the batch.
+def run_batch(operation, batch_params):
+    results = []
+    for params in batch_params:
+        try:
+            results.append(operation(params))
+        except ValueError as e:
+            results.append(fail(str(e)))
+        except ArithmeticError:
+            results.append(fail('Result is out of range'))
+        except Exception as e:
+            results.append(fail(f'Calculation failed: {e}'))
+    return results
+
+
+class LRUCache:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    # Like get, but a missing key isn't counted - for rechecking a key that
+    # already missed once
+    def lookup(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        return None
+
+    def put(self, key, value):
+        if self.capacity <= 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+
+class Stats:
+    def __init__(self, window=10000, rate_window=10.0):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.computed = 0
+        self.latencies = deque(maxlen=window)
+        # Completion times of recent requests, for throughput over rate_window seconds
+        self.rate_window = rate_window
+        self.completed = deque()
+
+    def record_request(self, latency, success):
+        self.requests += 1
+        if not success:
+            self.errors += 1
+        self.latencies.append(latency)
+        now = time.monotonic()
+        self.completed.append(now)
+        self.expire(now)
+
+    def expire(self, now):
+        while self.completed and self.completed[0] <= now - self.rate_window:
+            self.completed.popleft()
+
+    # Requests per second over the last rate_window seconds, so idle time
+    # before a burst doesn't dilute the rate
+    def throughput(self, now):
+        self.expire(now)
+        elapsed = min(self.rate_window, now - self.started)
+        return len(self.completed) / elapsed if elapsed > 0 else 0.0
+
+    def record_batch(self, size, computed):
+        self.batches += 1
+        self.batched_items += size
+        self.computed += computed
+
+    def snapshot(self, cache):
+        now = time.monotonic()
+        uptime = now - self.started
+        ordered = sorted(self.latencies)
+
+        def percentile(fraction):
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+        return {
+            'uptimeSeconds': uptime,
+            'requests': self.requests,
+            'errors': self.errors,
+            'throughputPerSecond': self.throughput(now),
+            'throughputWindowSeconds': self.rate_window,
+            'lifetimeThroughputPerSecond': self.requests / uptime if uptime > 0 else 0.0,
+            'latencyMs': {
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99),
+                'max': ordered[-1] * 1000 if ordered else 0.0,
+            },
+            'batches': self.batches,
+            'meanBatchSize': self.batched_items / self.batches if self.batches else 0.0,
+            'computed': self.computed,
+            'cache': {
+                'size': len(cache.entries),
+                'capacity': cache.capacity,
+                'hits': cache.hits,
+                'misses': cache.misses,
+                'evictions': cache.evictions,
+            },
+        }
+
+
+class MicroBatcher:
+    """
+    Collects requests for up to max_delay seconds (or max_size requests),
+    then computes each operation's unique inputs in a single pass.
+    """
+
+    def __init__(self, operations, cache, stats, max_size=256, max_delay=0.002):
+        self.operations = operations
+        self.cache = cache
+        self.stats = stats
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.queue = asyncio.Queue()
+
+    async def submit(self, params):
+        if not isinstance(params, dict):
+            return fail('Request must be a JSON object')
+        op = params.get('op')
+        if not isinstance(op, str) or op not in self.operations:
+            return fail(f'Unknown operation: {op}')
+
+        key = (op, json.dumps(params, sort_keys=True))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((op, key, params, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # One bad batch must not stop the loop and strand later requests
+            try:
+                self.flush(batch)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+                for _, _, _, future in batch:
+                    if not future.done():
+                        future.set_result(fail('Internal error'))
+
+    def flush(self, batch):
+        # Group by operation and drop duplicate inputs within the batch
+        pending = {}
+        for op, key, params, future in batch:
+            group = pending.setdefault(op, OrderedDict())
+            group.setdefault(key, (params, []))[1].append(future)
+
+        computed = 0
+        for op, group in pending.items():
+            # A previous batch may have cached some of these since submit()
+            results = {}
+            misses = []
+            for key in group:
+                cached = self.cache.lookup(key)
+                if cached is None:
+                    misses.append(key)
+                else:
+                    results[key] = cached
+            for key, result in zip(misses, run_batch(self.operations[op], [group[key][0] for key in misses])):
+                results[key] = result
+                self.cache.put(key, result)
+            computed += len(misses)
+
+            for key, (_, futures) in group.items():
+                result = results[key]
+                for future in futures:
+                    if not future.done():
+                        future.set_result(result)
+
+        self.stats.record_batch(len(batch), computed)
+
+
+class CalculationService:
+    def __init__(self, batcher, stats, cache):
+        self.batcher = batcher
+        self.stats = stats
+        self.cache = cache
+
+    async def calculate(self, body):
+        started = time.perf_counter()
+        try:
+            payload = json.loads(body or b'null')
+        except ValueError:
+            return 400, fail('Invalid JSON body')
+
+        if isinstance(payload, list):
+            results = await asyncio.gather(*(self.batcher.submit(item) for item in payload))
+            latency = time.perf_counter() - started
+            for result in results:
+                self.stats.record_request(latency, result['success'])
+            return 200, results
+
+        result = await self.batcher.submit(payload)
+        self.stats.record_request(time.perf_counter() - started, result['success'])
+        return 200, result
+
+    async def route(self, method, path, body):
+        if method == 'POST' and path == '/calculate':
+            return await self.calculate(body)
+        if method == 'GET' and path == '/stats':
+            return 200, self.stats.snapshot(self.cache)
+        return 404, fail(f'No route for {method} {path}')
+
+    async def respond(self, writer, status, payload, keep_alive):
+        data = json.dumps(payload).encode('utf-8')
+        writer.write(
+            f'HTTP/1.1 {status} {"OK" if status == 200 else "Error"}\r\n'
+            f'Content-Type: application/json\r\n'
+            f'Content-Length: {len(data)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode('latin-1') + data
+        )
+        await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                except ValueError:
+                    # readline raises ValueError for lines past the stream limit
+                    await self.respond(writer, 431, fail('Request line or header too long'), False)
+                    break
+
+                try:
+                    method, path, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                try:
+                    length = int(headers.get('content-length', 0))
+                except ValueError:
+                    length = -1
+                # In both cases the body is left unread, so answer and drop the connection
+                if length < 0:
+                    await self.respond(writer, 400, fail('Invalid Content-Length header'), False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self.respond(writer, 413, fail(f'Request body exceeds {MAX_BODY_BYTES} bytes'), False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self.route(method, path.split('?', 1)[0], body)
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(port, cache_size, max_batch, max_delay_ms):
+    operations = build_operations(load_elements())
+    cache = LRUCache(cache_size)
+    stats = Stats()
+    batcher = MicroBatcher(operations, cache, stats, max_size=max_batch, max_delay=max_delay_ms / 1000)
+    service = CalculationService(batcher, stats, cache)
+
+    batch_task = asyncio.create_task(batcher.run())
+    server = await asyncio.start_server(service.handle_connection, HOST, port)
+    print(f'Calculation service listening on http://{HOST}:{port}')
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batch_task.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local MolecuLab calculation service')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--cache-size', type=int, default=10000, help='LRU cache entries (0 disables caching)')
+    parser.add_argument('--max-batch', type=int, default=256, help='Maximum requests per batch')
+    parser.add_argument('--max-delay-ms', type=float, default=2.0, help='How long to wait to fill a batch')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.port, args.cache_size, args.max_batch, args.max_delay_ms))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
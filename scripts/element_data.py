@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Load the app's data tables (src/data/*.ts) into Python dicts.
+Shared by the scripts that need the same data the app ships with.
+"""
+
+import json
+import re
+
+ELEMENTS_PATH = 'src/data/elements.ts'
+POLYATOMIC_IONS_PATH = 'src/data/polyatomic-ions.ts'
+FUNCTIONAL_GROUPS_PATH = 'src/data/functional-groups.ts'
+
+# Matches one property line inside a multi-line entry, e.g. "    atomicMass: 1.008,"
+property_pattern = re.compile(r'^    (\w+): (.*),$')
+# Matches each property of a single-line entry, e.g. "{ name: 'Nitrite', charge: -1 }"
+inline_property_pattern = re.compile(r"(\w+): ('[^']*'|[^,}]+)")
+alt_name_pattern = re.compile(r"(\w+): '([^']*)'")
+string_pattern = re.compile(r"'([^']*)'")
+
+
+# Convert a TypeScript literal from the data files into a Python value
+def parse_value(raw):
+    raw = raw.strip()
+    if raw == 'null':
+        return None
+    if raw.startswith("'"):
+        return raw[1:-1]
+    if raw.startswith('['):
+        if "'" in raw:
+            return string_pattern.findall(raw)
+        return json.loads(raw)
+    if raw.startswith('{'):
+        return dict(alt_name_pattern.findall(raw))
+    if re.fullmatch(r'[+-]?\d+', raw):
+        return int(raw)
+    return float(raw)
+
+
+# Read the entries of an exported "const NAME = [ ... ] as const;" array
+def load_ts_array(path, name):
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # Only read the array itself, not the types or helper functions around it
+    start = content.index(f'export const {name}')
+    end = content.index('] as const;', start)
+
+    entries = []
+    current = None
+    for line in content[start:end].splitlines():
+        if line == '  {':
+            current = {}
+        elif line == '  },':
+            entries.append(current)
+            current = None
+        elif current is not None:
+            match = property_pattern.match(line)
+            if match:
+                current[match.group(1)] = parse_value(match.group(2))
+        elif line.startswith('  {') and line.endswith('},'):
+            entries.append({key: parse_value(value) for key, value in inline_property_pattern.findall(line)})
+
+    return entries
+
+
+def load_elements(path=ELEMENTS_PATH):
+    return load_ts_array(path, 'ELEMENTS')
+
+
+def load_polyatomic_ions(path=POLYATOMIC_IONS_PATH):
+    return load_ts_array(path, 'POLYATOMIC_IONS')
+
+
+def load_functional_groups(path=FUNCTIONAL_GROUPS_PATH):
+    return load_ts_array(path, 'FUNCTIONAL_GROUPS')
+
+
+def elements_by_symbol(elements):
+    return {el['symbol']: el for el in elements}
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Flashcard decks for the study tools, built from the element, polyatomic ion
+and functional group tables. Cards are [front, back] pairs, deduplicated so
+large decks stay compact.
+"""
+
+from element_data import load_functional_groups, load_polyatomic_ions
+
+LOCALE_LABELS = {'af': 'Afrikaans', 'latin': 'Latin'}
+
+# (Element property, question label, unit)
+ELEMENT_PROPERTIES = [
+    ('atomicNumber', 'Atomic number', ''),
+    ('atomicMass', 'Atomic mass', ' u'),
+    ('electronConfig', 'Electron configuration', ''),
+    ('category', 'Category', ''),
+    ('group', 'Group', ''),
+    ('period', 'Period', ''),
+    ('electronegativity', 'Electronegativity', ''),
+    ('ionizationEnergy', 'Ionization energy', ' kJ/mol'),
+    ('electronAffinity', 'Electron affinity', ' kJ/mol'),
+    ('atomicRadius', 'Atomic radius', ' pm'),
+    ('valenceElectrons', 'Valence electrons', ''),
+    ('oxidationStates', 'Oxidation states', ''),
+]
+
+
+def format_charge(charge):
+    return f"{'+' if charge > 0 else ''}{charge}"
+
+
+def format_property(prop, value, unit):
+    if prop == 'oxidationStates':
+        return ', '.join(format_charge(v) for v in value)
+    if prop == 'category':
+        return value.replace('-', ' ')
+    return f'{value}{unit}'
+
+
+# Drop blank and repeated cards; a front seen twice gets its backs merged
+def dedupe(cards):
+    backs = {}
+    for front, back in cards:
+        front, back = front.strip(), back.strip()
+        if not front or not back or front == back:
+            continue
+        merged = backs.setdefault(front, [])
+        if back not in merged:
+            merged.append(back)
+    return [(front, ' / '.join(merged)) for front, merged in backs.items()]
+
+
+def element_symbol_cards(elements):
+    return [(el['symbol'], el['name']) for el in elements]
+
+
+def element_property_cards(elements):
+    cards = []
+    for prop, label, unit in ELEMENT_PROPERTIES:
+        for el in elements:
+            value = el.get(prop)
+            if value is None or value == []:
+                continue
+            cards.append((f"{label} of {el['name']}", format_property(prop, value, unit)))
+    return cards
+
+
+def element_name_cards(elements):
+    cards = []
+    for locale, language in LOCALE_LABELS.items():
+        for el in elements:
+            translated = el.get('alternativeNames', {}).get(locale)
+            # Skip names that are the same in both languages
+            if translated and translated != el['name']:
+                cards.append((f"{el['name']} ({language})", translated))
+    return cards
+
+
+def polyatomic_ion_cards(ions):
+    cards = [(ion['formula'], f"{ion['name']} ({format_charge(ion['charge'])})") for ion in ions]
+    cards += [(ion['name'], ion['formula']) for ion in ions]
+    return cards
+
+
+def functional_group_cards(groups):
+    return [(fg['structure'], f"{fg['name']} ({fg['suffix']})") for fg in groups]
+
+
+# (deck id, label, cards) for every deck, in display order
+def build_decks(elements):
+    decks = [
+        ('elements', 'Elements', element_symbol_cards(elements)),
+        ('element-properties', 'Element Properties', element_property_cards(elements)),
+        ('element-names', 'Element Names', element_name_cards(elements)),
+        ('polyatomic-ions', 'Polyatomic Ions', polyatomic_ion_cards(load_polyatomic_ions())),
+        ('functional-groups', 'Functional Groups', functional_group_cards(load_functional_groups())),
+    ]
+    return [(deck_id, label, dedupe(cards)) for deck_id, label, cards in decks]
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Periodic table layout and trend color scales, shared by the data generators.
+"""
+
+# Trend id used by the app -> Element property it visualizes
+TRENDS = {
+    'atomic-radius': 'atomicRadius',
+    'ionization-energy': 'ionizationEnergy',
+    'electronegativity': 'electronegativity',
+    'electron-affinity': 'electronAffinity',
+}
+
+COLOR_BINS = 32
+
+# Lanthanides and actinides sit in rows 9 and 10, below the main table
+F_BLOCK_ROWS = {'lanthanide': 9, 'actinide': 10}
+F_BLOCK_START = {'lanthanide': 58, 'actinide': 90}
+
+
+def grid_position(el):
+    category = el['category']
+    if category in F_BLOCK_ROWS and el['atomicNumber'] >= F_BLOCK_START[category]:
+        return F_BLOCK_ROWS[category], el['atomicNumber'] - F_BLOCK_START[category] + 4
+    return el['period'], el['group']
+
+
+# Blue gradient used by the periodic table's trend view. The 0.7 power curve
+# makes differences more pronounced; opacity runs from 0.15 to 1.0.
+def trend_color(normalized):
+    normalized = normalized ** 0.7
+    opacity = 0.15 + normalized * 0.85
+    r = round(59 - normalized * 29)
+    g = round(130 - normalized * 66)
+    b = round(246 - normalized * 71)
+    return f'rgba({r}, {g}, {b}, {opacity:.4g})'
+
+
+def trend_scale(elements, prop):
+    values = [el[prop] for el in elements]
+    present = [v for v in values if v is not None]
+    low, high = min(present), max(present)
+    span = high - low
+
+    # With no spread there is nothing to color, as in the old getTrendColor
+    if span == 0:
+        normalized = [None if v is None else 0 for v in values]
+        return low, high, normalized, [None] * len(values)
+
+    exact = [None if v is None else (v - low) / span for v in values]
+    normalized = [None if n is None else round(n, 4) for n in exact]
+    # Bin i is colored at i / (COLOR_BINS - 1), so round to the nearest palette point
+    bins = [None if n is None else round(n * (COLOR_BINS - 1)) for n in exact]
+    return low, high, normalized, bins
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/calc-service.py.
+
+Expected values come from the TypeScript implementations in
+src/utils/calculations.ts and src/utils/chemical-formulas.ts.
+
+Run from the repository root:
+    python3 -m unittest discover -s scripts
+"""
+
+import asyncio
+import importlib.util
+import os
+import unittest
+
+from element_data import load_elements
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+
+spec = importlib.util.spec_from_file_location('calc_service', os.path.join(SCRIPTS_DIR, 'calc-service.py'))
+calc_service = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(calc_service)
+
+OPERATIONS = calc_service.build_operations(load_elements(os.path.join(ROOT_DIR, 'src/data/elements.ts')))
+
+
+def calculate(params):
+    return calc_service.run_batch(OPERATIONS[params['op']], [params])[0]
+
+
+class OperationTests(unittest.TestCase):
+    def test_molar_mass(self):
+        result = calculate({'op': 'molarMass', 'formula': 'H2O'})
+        self.assertTrue(result['success'])
+        self.assertAlmostEqual(result['data']['molarMass'], 18.015)
+        self.assertEqual([(p['element'], p['count']) for p in result['data']['breakdown']], [('H', 2), ('O', 1)])
+
+    def test_molar_mass_errors(self):
+        self.assertEqual(calculate({'op': 'molarMass', 'formula': ''}), calc_service.fail('Formula cannot be empty'))
+        self.assertEqual(calculate({'op': 'molarMass', 'formula': 'Xx'}), calc_service.fail('Unknown element: Xx'))
+        self.assertEqual(
+            calculate({'op': 'molarMass', 'formula': 'h2o'}),
+            calc_service.fail('Invalid formula: expected element at position 0'),
+        )
+
+    def test_mole_conversions(self):
+        self.assertAlmostEqual(calculate({'op': 'molesToMass', 'moles': 2, 'molarMass': 18.015})['data'], 36.03)
+        self.assertAlmostEqual(calculate({'op': 'massToMoles', 'mass': 44.01, 'molarMass': 44.01})['data'], 1)
+        self.assertAlmostEqual(calculate({'op': 'molesToParticles', 'moles': 1})['data'], 6.022e23)
+        self.assertAlmostEqual(calculate({'op': 'particlesToMoles', 'particles': 6.022e23})['data'], 1)
+        self.assertEqual(
+            calculate({'op': 'massToMoles', 'mass': 1, 'molarMass': 0}),
+            calc_service.fail('Molar mass must be positive'),
+        )
+        self.assertEqual(
+            calculate({'op': 'particlesToMoles', 'particles': -1}),
+            calc_service.fail('Particle count cannot be negative'),
+        )
+
+    def test_ph(self):
+        data = calculate({'op': 'pH', 'pH': 3})['data']
+        self.assertEqual(data['pOH'], 11)
+        self.assertAlmostEqual(data['hConcentration'], 1e-3)
+        self.assertAlmostEqual(data['ohConcentration'], 1e-11)
+
+        data = calculate({'op': 'pH', 'ohConcentration': 1e-4})['data']
+        self.assertAlmostEqual(data['pOH'], 4)
+        self.assertAlmostEqual(data['pH'], 10)
+
+        self.assertEqual(
+            calculate({'op': 'pH', 'hConcentration': 0}),
+            calc_service.fail('H+ concentration must be positive'),
+        )
+
+    def test_numbers_are_floats(self):
+        data = calculate({'op': 'pH', 'pH': 7})['data']
+        self.assertIsInstance(data['pH'], float)
+        self.assertIsInstance(data['pOH'], float)
+        data = calculate({'op': 'molesToMass', 'moles': 10 ** 20, 'molarMass': 2})['data']
+        self.assertIsInstance(data, float)
+
+    def test_ideal_gas(self):
+        data = calculate({'op': 'idealGas', 'pressure': 1, 'volume': 22.4, 'moles': 1})['data']
+        self.assertAlmostEqual(data['temperature'], 272.8380024360536)
+        self.assertEqual(data['unit'], 'K')
+        self.assertEqual(
+            calculate({'op': 'idealGas', 'pressure': 1}),
+            calc_service.fail('At least 3 variables must be provided'),
+        )
+        self.assertEqual(
+            calculate({'op': 'idealGas', 'pressure': 5, 'volume': 22.4, 'moles': 1, 'temperature': 273}),
+            calc_service.fail('Provided values do not satisfy PV = nRT'),
+        )
+
+    def test_specific_heat(self):
+        data = calculate({'op': 'specificHeat', 'mass': 10, 'specificHeat': 4.184, 'temperatureChange': 5})['data']
+        self.assertAlmostEqual(data['heat'], 209.2)
+        self.assertEqual(data['steps'], [
+            'q = m × c × ΔT',
+            'q = 10.00 g × 4.184 J/(g·°C) × 5.00 °C',
+            'q = 209.20 J',
+        ])
+
+    def test_overflow_fails_the_request(self):
+        self.assertFalse(calculate({'op': 'pH', 'pH': -400.5})['success'])
+        self.assertFalse(calculate({'op': 'molarMass', 'formula': 'H' + '9' * 400})['success'])
+        self.assertEqual(calculate({'op': 'pH', 'pH': 10 ** 400}), calc_service.fail('pH is out of range'))
+
+    def test_non_numeric_input(self):
+        self.assertEqual(
+            calculate({'op': 'molesToMass', 'moles': 'x', 'molarMass': 2}),
+            calc_service.fail('moles must be a number'),
+        )
+
+
+class LRUCacheTests(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = calc_service.LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_lookup_refreshes_without_counting_misses(self):
+        cache = calc_service.LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.lookup('a'), 1)
+        self.assertIsNone(cache.lookup('x'))
+        cache.put('c', 3)
+
+        self.assertIn('a', cache.entries)
+        self.assertNotIn('b', cache.entries)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+
+class StatsTests(unittest.TestCase):
+    def test_throughput_ignores_idle_time(self):
+        stats = calc_service.Stats(rate_window=10.0)
+        # Started long ago, then a burst of 50 requests
+        stats.started -= 100
+        for _ in range(50):
+            stats.record_request(0.001, True)
+
+        snapshot = stats.snapshot(calc_service.LRUCache(1))
+        self.assertAlmostEqual(snapshot['throughputPerSecond'], 5.0, places=3)
+        self.assertLess(snapshot['lifetimeThroughputPerSecond'], 1.0)
+        self.assertEqual(snapshot['requests'], 50)
+
+    def test_old_requests_leave_the_window(self):
+        stats = calc_service.Stats(rate_window=10.0)
+        stats.started -= 100
+        stats.record_request(0.001, True)
+        stats.completed[0] -= 20
+
+        self.assertEqual(stats.snapshot(calc_service.LRUCache(1))['throughputPerSecond'], 0.0)
+
+
+class MicroBatcherTests(unittest.TestCase):
+    def run_with_batcher(self, scenario, cache_size=100):
+        async def main():
+            cache = calc_service.LRUCache(cache_size)
+            stats = calc_service.Stats()
+            batcher = calc_service.MicroBatcher(OPERATIONS, cache, stats, max_delay=0.01)
+            task = asyncio.create_task(batcher.run())
+            try:
+                return await asyncio.wait_for(scenario(batcher, stats), 5)
+            finally:
+                task.cancel()
+
+        return asyncio.run(main())
+
+    def test_dedupes_within_a_batch(self):
+        async def scenario(batcher, stats):
+            params = {'op': 'molarMass', 'formula': 'CO2'}
+            results = await asyncio.gather(*(batcher.submit(dict(params)) for _ in range(5)))
+            return results, stats
+
+        results, stats = self.run_with_batcher(scenario, cache_size=0)
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(stats.batches, 1)
+        self.assertEqual(stats.computed, 1)
+
+    def test_batch_counts_entries_cached_since_submit(self):
+        async def scenario(batcher, stats):
+            params = {'op': 'molarMass', 'formula': 'NH3'}
+            key = ('molarMass', calc_service.json.dumps(params, sort_keys=True))
+            pending = asyncio.ensure_future(batcher.submit(dict(params)))
+            await asyncio.sleep(0)
+            # Another batch cached the result while this request was queued
+            batcher.cache.put(key, calc_service.ok('cached'))
+            return await pending, batcher.cache
+
+        result, cache = self.run_with_batcher(scenario)
+        self.assertEqual(result['data'], 'cached')
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_bad_requests_do_not_stop_batching(self):
+        async def scenario(batcher, stats):
+            bad = await asyncio.gather(
+                batcher.submit({'op': 'pH', 'pH': -400.5}),
+                batcher.submit({'op': 'molarMass', 'formula': 'H' + '9' * 400}),
+            )
+            good = await batcher.submit({'op': 'molarMass', 'formula': 'H2O'})
+            return bad, good
+
+        bad, good = self.run_with_batcher(scenario)
+        self.assertFalse(any(r['success'] for r in bad))
+        self.assertTrue(good['success'])
+
+    def test_invalid_op(self):
+        async def scenario(batcher, stats):
+            return await asyncio.gather(
+                batcher.submit({'op': {}}),
+                batcher.submit({'op': []}),
+                batcher.submit({'op': 'bogus'}),
+                batcher.submit([]),
+            )
+
+        results = self.run_with_batcher(scenario)
+        self.assertFalse(any(r['success'] for r in results))
+
+
+class HttpTests(unittest.TestCase):
+    def request(self, raw):
+        async def main():
+            cache = calc_service.LRUCache(100)
+            stats = calc_service.Stats()
+            batcher = calc_service.MicroBatcher(OPERATIONS, cache, stats)
+            service = calc_service.CalculationService(batcher, stats, cache)
+            task = asyncio.create_task(batcher.run())
+            server = await asyncio.start_server(service.handle_connection, calc_service.HOST, 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection(calc_service.HOST, port)
+                writer.write(raw)
+                await writer.drain()
+                response = await asyncio.wait_for(reader.read(), 5)
+                writer.close()
+                return response
+            finally:
+                server.close()
+                task.cancel()
+
+        return asyncio.run(main())
+
+    def test_calculate(self):
+        body = b'{"op": "molarMass", "formula": "NaCl"}'
+        response = self.request(
+            b'POST /calculate HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n' % len(body) + body
+        )
+        self.assertTrue(response.startswith(b'HTTP/1.1 200'))
+        self.assertIn(b'"success": true', response)
+
+    def test_bad_content_length(self):
+        response = self.request(b'POST /calculate HTTP/1.1\r\nContent-Length: abc\r\n\r\n')
+        self.assertTrue(response.startswith(b'HTTP/1.1 400'))
+        self.assertIn(b'Invalid Content-Length header', response)
+
+    def test_header_too_long(self):
+        response = self.request(b'POST /calculate HTTP/1.1\r\nX-Padding: ' + b'a' * 70000 + b'\r\n\r\n')
+        self.assertTrue(response.startswith(b'HTTP/1.1 431'))
+
+    def test_body_too_large(self):
+        response = self.request(
+            b'POST /calculate HTTP/1.1\r\nContent-Length: %d\r\n\r\n' % (calc_service.MAX_BODY_BYTES + 1)
+        )
+        self.assertTrue(response.startswith(b'HTTP/1.1 413'))
+
+    def test_unhashable_op(self):
+        body = b'{"op": {}}'
+        response = self.request(
+            b'POST /calculate HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n' % len(body) + body
+        )
+        self.assertTrue(response.startswith(b'HTTP/1.1 200'))
+        self.assertIn(b'Unknown operation', response)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
-import { useEffect, useRef, useState } from 'react';
+import { useEffect, useMemo, useRef, useState } from 'react';
 import { usePeriodicTableStore } from '../../stores/periodic-table-store';
 import { ELEMENTS } from '../../data/elements';
+import { useDataArtifact } from '../../utils/data-artifacts';
+import type { PeriodicLayout, TrendId } from '../../types/periodic-layout';
 import ElementCard from './element-card';
 import GroupPeriodCard from './group-period-card';
 
@@ -30,8 +32,31 @@ const CATEGORY_COLORS: Record<string, string> = {
   'unknown-properties': 'bg-gray-400 hover:bg-gray-500',
 };
 
+// Map grid positions to elements; layout comes from the periodic-layout artifact
+const mapElementsByPosition = (layout: PeriodicLayout | null) => {
+  const elementsByPosition = new Map<string, typeof ELEMENTS[number]>();
+  if (!layout) return elementsByPosition;
+  for (const element of ELEMENTS) {
+    const pos = layout.positions[element.atomicNumber];
+    if (pos) {
+      elementsByPosition.set(`${pos[0]}-${pos[1]}`, element);
+    }
+  }
+  return elementsByPosition;
+};
+
+// Trend color for an element, or null when it has no value for the trend
+const getTrendColor = (layout: PeriodicLayout, trend: TrendId, element: typeof ELEMENTS[number]): string | null => {
+  const bin = layout.trends[trend].bins[element.atomicNumber - 1];
+  return bin === null ? null : layout.colorBins[bin];
+};
+
 const PeriodicTable = () => {
   const { selectedElement, activeTrend, filter, selectedGroup, selectedPeriod, dispatch } = usePeriodicTableStore();
+  const { artifact: layoutArtifact, error: layoutError } = useDataArtifact<PeriodicLayout>('periodic-layout');
+  const layout = layoutArtifact?.data ?? null;
+  // Empty until the layout loads, which leaves a blank grid of the same size
+  const elementsByPosition = useMemo(() => mapElementsByPosition(layout), [layout]);
   const containerRef = useRef<HTMLDivElement>(null);
   const tableRef = useRef<HTMLDivElement>(null);
   const [scale, setScale] = useState(1);
@@ -122,153 +147,6 @@ const PeriodicTable = () => {
     return element.category === filter;
   });
 
-  // Map atomic number to grid position (row, col) in 18-column grid
-  const getElementGridPosition = (atomicNumber: number): { row: number; col: number } | null => {
-    // Standard periodic table layout
-    const positions: Record<number, { row: number; col: number }> = {
-      // Period 1
-      1: { row: 1, col: 1 },   // H
-      2: { row: 1, col: 18 },  // He
-      // Period 2
-      3: { row: 2, col: 1 },   // Li
-      4: { row: 2, col: 2 },   // Be
-      5: { row: 2, col: 13 },  // B
-      6: { row: 2, col: 14 },  // C
-      7: { row: 2, col: 15 },  // N
-      8: { row: 2, col: 16 },  // O
-      9: { row: 2, col: 17 },  // F
-      10: { row: 2, col: 18 }, // Ne
-      // Period 3
-      11: { row: 3, col: 1 },  // Na
-      12: { row: 3, col: 2 },  // Mg
-      13: { row: 3, col: 13 }, // Al
-      14: { row: 3, col: 14 }, // Si
-      15: { row: 3, col: 15 }, // P
-      16: { row: 3, col: 16 }, // S
-      17: { row: 3, col: 17 }, // Cl
-      18: { row: 3, col: 18 }, // Ar
-      // Period 4
-      19: { row: 4, col: 1 },  // K
-      20: { row: 4, col: 2 },  // Ca
-      21: { row: 4, col: 3 },  // Sc
-      22: { row: 4, col: 4 },  // Ti
-      23: { row: 4, col: 5 },  // V
-      24: { row: 4, col: 6 },  // Cr
-      25: { row: 4, col: 7 },  // Mn
-      26: { row: 4, col: 8 },  // Fe
-      27: { row: 4, col: 9 },  // Co
-      28: { row: 4, col: 10 }, // Ni
-      29: { row: 4, col: 11 }, // Cu
-      30: { row: 4, col: 12 }, // Zn
-      31: { row: 4, col: 13 }, // Ga
-      32: { row: 4, col: 14 }, // Ge
-      33: { row: 4, col: 15 }, // As
-      34: { row: 4, col: 16 }, // Se
-      35: { row: 4, col: 17 }, // Br
-      36: { row: 4, col: 18 }, // Kr
-      // Period 5
-      37: { row: 5, col: 1 },  // Rb
-      38: { row: 5, col: 2 },  // Sr
-      39: { row: 5, col: 3 },  // Y
-      40: { row: 5, col: 4 },  // Zr
-      41: { row: 5, col: 5 },  // Nb
-      42: { row: 5, col: 6 },  // Mo
-      43: { row: 5, col: 7 },  // Tc
-      44: { row: 5, col: 8 },  // Ru
-      45: { row: 5, col: 9 },  // Rh
-      46: { row: 5, col: 10 }, // Pd
-      47: { row: 5, col: 11 }, // Ag
-      48: { row: 5, col: 12 }, // Cd
-      49: { row: 5, col: 13 }, // In
-      50: { row: 5, col: 14 }, // Sn
-      51: { row: 5, col: 15 }, // Sb
-      52: { row: 5, col: 16 }, // Te
-      53: { row: 5, col: 17 }, // I
-      54: { row: 5, col: 18 }, // Xe
-      // Period 6
-      55: { row: 6, col: 1 },  // Cs
-      56: { row: 6, col: 2 },  // Ba
-      57: { row: 6, col: 3 },  // La
-      // Lanthanides (row 9, below main table)
-      58: { row: 9, col: 4 },  // Ce
-      59: { row: 9, col: 5 },  // Pr
-      60: { row: 9, col: 6 },  // Nd
-      61: { row: 9, col: 7 },  // Pm
-      62: { row: 9, col: 8 },  // Sm
-      63: { row: 9, col: 9 },  // Eu
-      64: { row: 9, col: 10 }, // Gd
-      65: { row: 9, col: 11 }, // Tb
-      66: { row: 9, col: 12 }, // Dy
-      67: { row: 9, col: 13 }, // Ho
-      68: { row: 9, col: 14 }, // Er
-      69: { row: 9, col: 15 }, // Tm
-      70: { row: 9, col: 16 }, // Yb
-      71: { row: 9, col: 17 }, // Lu
-      // Continue Period 6
-      72: { row: 6, col: 4 },  // Hf
-      73: { row: 6, col: 5 },  // Ta
-      74: { row: 6, col: 6 },  // W
-      75: { row: 6, col: 7 },  // Re
-      76: { row: 6, col: 8 },  // Os
-      77: { row: 6, col: 9 },  // Ir
-      78: { row: 6, col: 10 }, // Pt
-      79: { row: 6, col: 11 }, // Au
-      80: { row: 6, col: 12 }, // Hg
-      81: { row: 6, col: 13 }, // Tl
-      82: { row: 6, col: 14 }, // Pb
-      83: { row: 6, col: 15 }, // Bi
-      84: { row: 6, col: 16 }, // Po
-      85: { row: 6, col: 17 }, // At
-      86: { row: 6, col: 18 }, // Rn
-      // Period 7
-      87: { row: 7, col: 1 },  // Fr
-      88: { row: 7, col: 2 },  // Ra
-      89: { row: 7, col: 3 },  // Ac
-      // Actinides (row 10, below lanthanides)
-      90: { row: 10, col: 4 },  // Th
-      91: { row: 10, col: 5 },  // Pa
-      92: { row: 10, col: 6 },  // U
-      93: { row: 10, col: 7 },  // Np
-      94: { row: 10, col: 8 },  // Pu
-      95: { row: 10, col: 9 },  // Am
-      96: { row: 10, col: 10 }, // Cm
-      97: { row: 10, col: 11 }, // Bk
-      98: { row: 10, col: 12 }, // Cf
-      99: { row: 10, col: 13 }, // Es
-      100: { row: 10, col: 14 }, // Fm
-      101: { row: 10, col: 15 }, // Md
-      102: { row: 10, col: 16 }, // No
-      103: { row: 10, col: 17 }, // Lr
-      // Continue Period 7
-      104: { row: 7, col: 4 },  // Rf
-      105: { row: 7, col: 5 },  // Db
-      106: { row: 7, col: 6 },  // Sg
-      107: { row: 7, col: 7 },  // Bh
-      108: { row: 7, col: 8 },  // Hs
-      109: { row: 7, col: 9 },  // Mt
-      110: { row: 7, col: 10 }, // Ds
-      111: { row: 7, col: 11 }, // Rg
-      112: { row: 7, col: 12 }, // Cn
-      113: { row: 7, col: 13 }, // Nh
-      114: { row: 7, col: 14 }, // Fl
-      115: { row: 7, col: 15 }, // Mc
-      116: { row: 7, col: 16 }, // Lv
-      117: { row: 7, col: 17 }, // Ts
-      118: { row: 7, col: 18 }, // Og
-    };
-
-    return positions[atomicNumber] || null;
-  };
-
-  // Build grid for display - map all elements to their positions
-  const elementsByPosition = new Map<string, typeof ELEMENTS[number]>();
-  for (const element of ELEMENTS) {
-    const pos = getElementGridPosition(element.atomicNumber);
-    if (pos) {
-      elementsByPosition.set(`${pos.row}-${pos.col}`, element);
-    }
-  }
-
   const handleElementClick = (element: typeof ELEMENTS[number]) => {
     if (selectedElement?.atomicNumber === element.atomicNumber) {
       dispatch({ type: 'SELECT_ELEMENT', payload: null });
@@ -277,68 +155,17 @@ const PeriodicTable = () => {
     }
   };
 
-  // Get trend value for an element
-  const getTrendValue = (element: typeof ELEMENTS[number]): number | null => {
-    if (!activeTrend) return null;
-    switch (activeTrend) {
-      case 'atomic-radius':
-        return element.atomicRadius;
-      case 'ionization-energy':
-        return element.ionizationEnergy;
-      case 'electronegativity':
-        return element.electronegativity;
-      case 'electron-affinity':
-        return element.electronAffinity;
-      default:
-        return null;
-    }
-  };
-
-  // Get trend color for an element (blue gradient - more dramatic)
-  const getTrendColor = (element: typeof ELEMENTS[number]): string | null => {
-    if (!activeTrend) return null;
-    const value = getTrendValue(element);
-    if (value === null) return null;
-
-    // Get all values for normalization
-    const allValues = ELEMENTS.map((el) => getTrendValue(el)).filter((v): v is number => v !== null);
-    if (allValues.length === 0) return null;
-
-    const min = Math.min(...allValues);
-    const max = Math.max(...allValues);
-    const range = max - min;
-    if (range === 0) return null;
-
-    // Normalize to 0-1
-    let normalized = (value - min) / range;
-    
-    // Apply power curve to enhance differences (square the normalized value for more dramatic contrast)
-    normalized = Math.pow(normalized, 0.7); // 0.7 power makes differences more pronounced
-    
-    // Use wider opacity range and darker colors for more dramatic effect
-    // Opacity ranges from 0.15 (very light) to 1.0 (very dark)
-    const opacity = 0.15 + normalized * 0.85;
-    
-    // Use darker blue shades for higher values
-    // Base blue: rgb(59, 130, 246), darker blue: rgb(30, 64, 175)
-    const blueR = Math.round(59 - normalized * 29); // 59 to 30
-    const blueG = Math.round(130 - normalized * 66); // 130 to 64
-    const blueB = Math.round(246 - normalized * 71); // 246 to 175
-    
-    return `rgba(${blueR}, ${blueG}, ${blueB}, ${opacity})`;
-  };
-
   const renderElementButton = (
     element: typeof ELEMENTS[number],
     filteredElements: readonly typeof ELEMENTS[number][],
     selectedElement: typeof ELEMENTS[number] | null,
-    activeTrend: 'atomic-radius' | 'ionization-energy' | 'electronegativity' | 'electron-affinity' | null,
+    activeTrend: TrendId | null,
     onClick: (element: typeof ELEMENTS[number]) => void
   ) => {
     const isHighlighted = filteredElements.includes(element);
     const isSelected = selectedElement?.atomicNumber === element.atomicNumber;
     const categoryColor = CATEGORY_COLORS[element.category] || 'bg-gray-300';
-    const trendColor = getTrendColor(element);
+    const trendColor = activeTrend && layout ? getTrendColor(layout, activeTrend, element) : null;
     const isActinide = element.category === 'actinide';
 
     // Custom color for actinides
@@ -523,6 +350,10 @@ const PeriodicTable = () => {
           </div>
         </div>
 
+        {layoutError && (
+          <p className="mb-2 text-sm text-red-600">Could not load the periodic table layout: {layoutError}</p>
+        )}
+
         {/* Periodic Table Grid */}
         <div 
           ref={containerRef} 
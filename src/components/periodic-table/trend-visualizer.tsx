@@ -1,19 +1,21 @@
 import { useEffect, useRef } from 'react';
 import * as d3 from 'd3';
 import { ELEMENTS } from '../../data/elements';
+import { useDataArtifact } from '../../utils/data-artifacts';
 import type { Element } from '../../types/element';
-
-type TrendType = 'atomic-radius' | 'ionization-energy' | 'electronegativity' | 'electron-affinity';
+import type { PeriodicLayout, TrendId } from '../../types/periodic-layout';
 
 type TrendVisualizerProps = {
-  trend: TrendType;
+  trend: TrendId;
 };
 
 const TrendVisualizer = ({ trend }: TrendVisualizerProps) => {
   const svgRef = useRef<SVGSVGElement>(null);
+  const { artifact: layoutArtifact } = useDataArtifact<PeriodicLayout>('periodic-layout');
+  const layout = layoutArtifact?.data ?? null;
 
   useEffect(() => {
-    if (!svgRef.current) return;
+    if (!svgRef.current || !layout) return;
 
     // Clear previous content
     d3.select(svgRef.current).selectAll('*').remove();
@@ -27,21 +29,9 @@ const TrendVisualizer = ({ trend }: TrendVisualizerProps) => {
       .attr('width', width)
       .attr('height', height);
 
-    // Filter elements with valid data for the trend
-    const elementsWithData = ELEMENTS.filter((el) => {
-      switch (trend) {
-        case 'atomic-radius':
-          return el.atomicRadius !== null;
-        case 'ionization-energy':
-          return el.ionizationEnergy !== null;
-        case 'electronegativity':
-          return el.electronegativity !== null;
-        case 'electron-affinity':
-          return el.electronAffinity !== null;
-        default:
-          return false;
-      }
-    });
+    // Precomputed range and normalized values for this trend
+    const scale = layout.trends[trend];
+    const elementsWithData = ELEMENTS.filter((el) => scale.normalized[el.atomicNumber - 1] !== null);
 
     if (elementsWithData.length === 0) {
       svg
@@ -55,28 +45,9 @@ const TrendVisualizer = ({ trend }: TrendVisualizerProps) => {
       return;
     }
 
-    // Get values
-    const getValue = (el: Element): number => {
-      switch (trend) {
-        case 'atomic-radius':
-          return el.atomicRadius!;
-        case 'ionization-energy':
-          return el.ionizationEnergy!;
-        case 'electronegativity':
-          return el.electronegativity!;
-        case 'electron-affinity':
-          return el.electronAffinity!;
-        default:
-          return 0;
-      }
-    };
-
-    const values = elementsWithData.map(getValue);
-    const minValue = Math.min(...values);
-    const maxValue = Math.max(...values);
-
-    // Color scale
-    const colorScale = d3.scaleSequential(d3.interpolateBlues).domain([minValue, maxValue]);
+    const getValue = (el: Element): number => el[scale.property]!;
+    const minValue = scale.min;
+    const maxValue = scale.max;
 
     // Create heat map cells
     const cellWidth = 50;
@@ -111,7 +82,7 @@ const TrendVisualizer = ({ trend }: TrendVisualizerProps) => {
       const x = startX + col * cellWidth;
       const y = margin.top + row * cellHeight;
       const value = getValue(element);
-      const color = colorScale(value);
+      const color = d3.interpolateBlues(scale.normalized[element.atomicNumber - 1]!);
 
       // Create cell
       const cell = svg
@@ -172,8 +143,7 @@ const TrendVisualizer = ({ trend }: TrendVisualizerProps) => {
 
     const numStops = 10;
     for (let i = 0; i <= numStops; i++) {
-      const value = minValue + ((maxValue - minValue) * i) / numStops;
-      gradient.append('stop').attr('offset', `${(i / numStops) * 100}%`).attr('stop-color', colorScale(value));
+      gradient.append('stop').attr('offset', `${(i / numStops) * 100}%`).attr('stop-color', d3.interpolateBlues(i / numStops));
     }
 
     legend
@@ -193,7 +163,7 @@ const TrendVisualizer = ({ trend }: TrendVisualizerProps) => {
       .attr('font-size', '12px')
       .attr('font-weight', 'bold')
       .text(title);
-  }, [trend]);
+  }, [trend, layout]);
 
   return (
     <div className="bg-gray-50 rounded-lg p-4">
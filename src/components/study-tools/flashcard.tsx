@@ -1,67 +1,138 @@
-import { useState } from 'react';
-import { ELEMENTS } from '../../data/elements';
-import { POLYATOMIC_IONS } from '../../data/polyatomic-ions';
-import { FUNCTIONAL_GROUPS } from '../../data/functional-groups';
+import { useEffect, useReducer, useRef, useState } from 'react';
+import {
+  createReviewState,
+  isCardDue,
+  packReviewState,
+  peekNextCard,
+  reviewNextCard,
+  unpackReviewState,
+} from '../../utils/spaced-repetition';
+import type { ReviewGrade, ReviewState } from '../../utils/spaced-repetition';
+import { useDataArtifact } from '../../utils/data-artifacts';
+import type { FlashcardCard, FlashcardDeckInfo } from '../../types/flashcard';
 import { motion } from 'framer-motion';
 
-type FlashcardCategory = 'elements' | 'polyatomic-ions' | 'functional-groups';
+const GRADES: { id: ReviewGrade; label: string; className: string }[] = [
+  { id: 'again', label: 'Again', className: 'bg-red-600 hover:bg-red-700' },
+  { id: 'hard', label: 'Hard', className: 'bg-orange-500 hover:bg-orange-600' },
+  { id: 'good', label: 'Good', className: 'bg-blue-600 hover:bg-blue-700' },
+  { id: 'easy', label: 'Easy', className: 'bg-green-600 hover:bg-green-700' },
+];
 
-type Flashcard = {
-  front: string;
-  back: string;
-  category: FlashcardCategory;
+const STORAGE_PREFIX = 'moleculab:flashcards:';
+
+// setTimeout overflows past ~24.8 days, so longer waits re-arm the timer
+const MAX_TIMER_MS = 0x7fffffff;
+
+// Progress is keyed by the deck's content hash, so an edited deck starts
+// fresh instead of applying old progress to different cards
+const storageKey = (deckId: string, hash: string) => `${STORAGE_PREFIX}${deckId}:${hash}`;
+
+const toBase64 = (bytes: Uint8Array): string => {
+  let binary = '';
+  for (let i = 0; i < bytes.length; i += 0x8000) {
+    binary += String.fromCharCode(...bytes.subarray(i, i + 0x8000));
+  }
+  return btoa(binary);
+};
+
+const fromBase64 = (text: string): Uint8Array => Uint8Array.from(atob(text), (c) => c.charCodeAt(0));
+
+// Restore saved progress for a deck, or start it fresh
+const loadReviewState = (deckId: string, hash: string, cardCount: number): ReviewState => {
+  const key = storageKey(deckId, hash);
+  try {
+    // Drop progress saved for earlier versions of this deck
+    for (let i = localStorage.length - 1; i >= 0; i--) {
+      const stored = localStorage.key(i);
+      if (stored?.startsWith(`${STORAGE_PREFIX}${deckId}:`) && stored !== key) {
+        localStorage.removeItem(stored);
+      }
+    }
+    const saved = localStorage.getItem(key);
+    const restored = saved ? unpackReviewState(fromBase64(saved), cardCount) : null;
+    if (restored) return restored;
+  } catch (error) {
+    console.error('Error restoring flashcard progress:', error);
+  }
+  return createReviewState(cardCount);
+};
+
+const saveReviewState = (deckId: string, hash: string, state: ReviewState): void => {
+  try {
+    localStorage.setItem(storageKey(deckId, hash), toBase64(packReviewState(state)));
+  } catch (error) {
+    console.error('Error saving flashcard progress:', error);
+  }
 };
 
 const FlashcardComponent = () => {
-  const [category, setCategory] = useState<FlashcardCategory>('elements');
-  const [currentIndex, setCurrentIndex] = useState(0);
+  const [deckId, setDeckId] = useState('elements');
   const [isFlipped, setIsFlipped] = useState(false);
+  // Cards reviewed this session, per deck
+  const [reviewedCounts, setReviewedCounts] = useState<Record<string, number>>({});
+  // Bumped to re-render after in-place review state changes and when a card falls due
+  const [renderTick, rerender] = useReducer((tick: number) => tick + 1, 0);
+  // Review state per deck version, restored on first use and mutated in place
+  const reviewStates = useRef(new Map<string, ReviewState>());
 
-  const getFlashcards = (): Flashcard[] => {
-    switch (category) {
-      case 'elements': {
-        const elements = ELEMENTS.slice(0, 20); // First 20 elements
-        return elements.map((el) => ({
-          front: el.symbol,
-          back: el.name,
-          category: 'elements',
-        }));
-      }
-      case 'polyatomic-ions':
-        return POLYATOMIC_IONS.map((ion) => ({
-          front: ion.formula,
-          back: `${ion.name} (${ion.charge > 0 ? '+' : ''}${ion.charge})`,
-          category: 'polyatomic-ions',
-        }));
-      case 'functional-groups':
-        return FUNCTIONAL_GROUPS.map((fg) => ({
-          front: fg.structure,
-          back: `${fg.name} (${fg.suffix})`,
-          category: 'functional-groups',
-        }));
-      default:
-        return [];
+  // The deck index is small; each deck's cards load only when it is selected
+  const { artifact: deckIndex, error: indexError } = useDataArtifact<readonly FlashcardDeckInfo[]>('flashcards');
+  const decks = deckIndex?.data ?? [];
+  const deck = decks.find((d) => d.id === deckId) ?? decks[0];
+  const { artifact: deckCards, error: cardsError } = useDataArtifact<readonly FlashcardCard[]>(deck?.artifact ?? null);
+  const cards = deckCards?.data ?? null;
+  const loadError = indexError ?? cardsError;
+
+  let reviewState: ReviewState | undefined;
+  if (deck && deckCards) {
+    const key = storageKey(deck.id, deckCards.hash);
+    reviewState = reviewStates.current.get(key);
+    if (!reviewState) {
+      reviewState = loadReviewState(deck.id, deckCards.hash, deckCards.data.length);
+      reviewStates.current.set(key, reviewState);
     }
-  };
+  }
 
-  const flashcards = getFlashcards();
-  const currentCard = flashcards[currentIndex];
+  const now = Date.now();
+  const cardIndex = reviewState ? peekNextCard(reviewState) : null;
+  const currentCard = cardIndex === null || !cards ? undefined : cards[cardIndex];
+  const isDue = reviewState !== undefined && cardIndex !== null && isCardDue(reviewState, cardIndex, now);
+  const dueAt = reviewState !== undefined && cardIndex !== null ? reviewState.due[cardIndex] : null;
 
-  const shuffle = () => {
-    setCurrentIndex(0);
-    setIsFlipped(false);
-    // Shuffle would be implemented with state management in full version
-  };
+  // Re-render when the next card falls due so the label doesn't go stale
+  useEffect(() => {
+    if (dueAt === null) return;
+    const delay = dueAt - Date.now();
+    if (delay <= 0) return;
+    const timer = setTimeout(rerender, Math.min(delay, MAX_TIMER_MS));
+    return () => clearTimeout(timer);
+  }, [dueAt, renderTick]);
 
-  const nextCard = () => {
-    setCurrentIndex((prev) => (prev + 1) % flashcards.length);
+  const gradeCard = (grade: ReviewGrade) => {
+    if (!reviewState || !deck || !deckCards) return;
+    reviewNextCard(reviewState, grade, Date.now());
+    saveReviewState(deck.id, deckCards.hash, reviewState);
+    setReviewedCounts((prev) => ({ ...prev, [deck.id]: (prev[deck.id] ?? 0) + 1 }));
+    rerender();
     setIsFlipped(false);
   };
 
-  const prevCard = () => {
-    setCurrentIndex((prev) => (prev - 1 + flashcards.length) % flashcards.length);
-    setIsFlipped(false);
-  };
+  if (loadError) {
+    return (
+      <div className="bg-white rounded-lg shadow-md p-6">
+        <p className="text-red-600">Could not load flashcards: {loadError}</p>
+      </div>
+    );
+  }
+
+  if (!deck || !cards) {
+    return (
+      <div className="bg-white rounded-lg shadow-md p-6">
+        <p className="text-gray-500">Loading flashcards…</p>
+      </div>
+    );
+  }
 
   if (!currentCard) {
     return (
@@ -78,21 +149,16 @@ const FlashcardComponent = () => {
       {/* Category Selector */}
       <div className="mb-4">
         <label className="block text-sm font-medium text-gray-700 mb-2">Category</label>
-        <div className="flex gap-2">
-          {[
-            { id: 'elements', label: 'Elements' },
-            { id: 'polyatomic-ions', label: 'Polyatomic Ions' },
-            { id: 'functional-groups', label: 'Functional Groups' },
-          ].map((cat) => (
+        <div className="flex flex-wrap gap-2">
+          {decks.map((cat) => (
             <button
               key={cat.id}
               onClick={() => {
-                setCategory(cat.id as FlashcardCategory);
-                setCurrentIndex(0);
+                setDeckId(cat.id);
                 setIsFlipped(false);
               }}
               className={`px-4 py-2 rounded-md text-sm font-medium transition-colors ${
-                category === cat.id
+                deck.id === cat.id
                   ? 'bg-blue-600 text-white'
                   : 'bg-gray-200 text-gray-700 hover:bg-gray-300'
               }`}
@@ -117,7 +183,7 @@ const FlashcardComponent = () => {
               className="absolute inset-0 bg-blue-500 text-white rounded-lg shadow-lg flex items-center justify-center text-2xl font-bold backface-hidden p-6"
               style={{ backfaceVisibility: 'hidden' }}
             >
-              {currentCard.front}
+              {currentCard[0]}
             </div>
             <div
               className="absolute inset-0 bg-green-500 text-white rounded-lg shadow-lg flex items-center justify-center text-xl font-bold backface-hidden p-6"
@@ -126,38 +192,29 @@ const FlashcardComponent = () => {
                 transform: 'rotateY(180deg)',
               }}
             >
-              {currentCard.back}
+              {currentCard[1]}
             </div>
           </motion.div>
         </div>
         <p className="text-center text-sm text-gray-500 mt-2">Click card to flip</p>
       </div>
 
-      {/* Controls */}
+      {/* Review grades */}
       <div className="flex gap-2">
-        <button
-          onClick={prevCard}
-          className="flex-1 px-4 py-2 bg-gray-200 text-gray-700 rounded-md hover:bg-gray-300 transition-colors font-medium"
-        >
-          Previous
-        </button>
-        <button
-          onClick={shuffle}
-          className="px-4 py-2 bg-purple-600 text-white rounded-md hover:bg-purple-700 transition-colors font-medium"
-        >
-          Shuffle
-        </button>
-        <button
-          onClick={nextCard}
-          className="flex-1 px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 transition-colors font-medium"
-        >
-          Next
-        </button>
+        {GRADES.map((grade) => (
+          <button
+            key={grade.id}
+            onClick={() => gradeCard(grade.id)}
+            className={`flex-1 px-4 py-2 text-white rounded-md transition-colors font-medium ${grade.className}`}
+          >
+            {grade.label}
+          </button>
+        ))}
       </div>
 
       {/* Progress */}
       <div className="mt-4 text-center text-sm text-gray-600">
-        Card {currentIndex + 1} of {flashcards.length}
+        {isDue ? 'Due now' : 'Reviewing ahead'} · {reviewedCounts[deck.id] ?? 0} reviewed · {deck.cardCount} cards in deck
       </div>
     </div>
   );
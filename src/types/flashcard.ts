@@ -0,0 +1,12 @@
+// Shape of the flashcard artifacts from scripts/build-data-artifacts.py
+
+export type FlashcardDeckInfo = {
+  readonly id: string;
+  readonly label: string;
+  // Manifest name of the artifact holding the deck's cards
+  readonly artifact: string;
+  readonly cardCount: number;
+};
+
+// [front, back]
+export type FlashcardCard = readonly [string, string];
@@ -0,0 +1,20 @@
+// Shape of the periodic-layout data artifact from scripts/build-data-artifacts.py
+
+export type TrendId = 'atomic-radius' | 'ionization-energy' | 'electronegativity' | 'electron-affinity';
+
+export type TrendScale = {
+  readonly property: 'atomicRadius' | 'ionizationEnergy' | 'electronegativity' | 'electronAffinity';
+  readonly min: number;
+  readonly max: number;
+  // Indexed by atomicNumber - 1; null where the element has no value
+  readonly normalized: readonly (number | null)[];
+  readonly bins: readonly (number | null)[];
+};
+
+export type PeriodicLayout = {
+  // [row, col] in the 18-column table, keyed by atomic number
+  readonly positions: Record<string, readonly [number, number]>;
+  // Trend colors, lightest (lowest value) to darkest
+  readonly colorBins: readonly string[];
+  readonly trends: Record<TrendId, TrendScale>;
+};
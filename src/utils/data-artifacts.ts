@@ -0,0 +1,127 @@
+/**
+ * Loader for the content-hashed data artifacts in public/data
+ * (built by scripts/build-data-artifacts.py)
+ * The manifest is fetched once per page load and always revalidated; each
+ * artifact URL changes with its content, so the browser caches it forever.
+ */
+
+import { useEffect, useState } from 'react';
+
+type ArtifactVariant = {
+  readonly path: string;
+  readonly bytes: number;
+};
+
+export type ArtifactEntry = {
+  readonly path: string;
+  readonly hash: string;
+  readonly bytes: number;
+  readonly gzip?: ArtifactVariant;
+  readonly br?: ArtifactVariant;
+};
+
+type Manifest = {
+  readonly artifacts: Record<string, ArtifactEntry>;
+};
+
+export type LoadedArtifact<T> = {
+  readonly name: string;
+  readonly hash: string;
+  readonly data: T;
+};
+
+const DATA_URL = `${import.meta.env.BASE_URL}data/`;
+
+let manifestRequest: Promise<Manifest> | null = null;
+const artifactRequests = new Map<string, Promise<LoadedArtifact<unknown>>>();
+
+const fetchJson = async <T>(url: string, init?: RequestInit): Promise<T> => {
+  const response = await fetch(url, init);
+  if (!response.ok) {
+    throw new Error(`Failed to load ${url}: ${response.status}`);
+  }
+  return (await response.json()) as T;
+};
+
+// Pre-compressed variants first. Servers that don't send their
+// Content-Encoding (the Vite dev and preview servers) return bytes that fail
+// to parse, so each variant falls back to the next and finally the plain file.
+const candidatePaths = (entry: ArtifactEntry): string[] => {
+  if (import.meta.env.DEV) return [entry.path];
+  return [entry.br?.path, entry.gzip?.path, entry.path].filter((path): path is string => path !== undefined);
+};
+
+export const loadManifest = (): Promise<Manifest> => {
+  if (!manifestRequest) {
+    manifestRequest = fetchJson<Manifest>(`${DATA_URL}manifest.json`, { cache: 'no-cache' });
+    // Let a later call retry after a failed request
+    manifestRequest.catch(() => {
+      manifestRequest = null;
+    });
+  }
+  return manifestRequest;
+};
+
+/**
+ * Load an artifact by its manifest name
+ * Concurrent and repeated calls share one request
+ */
+export const loadArtifact = <T>(name: string): Promise<LoadedArtifact<T>> => {
+  let request = artifactRequests.get(name);
+  if (!request) {
+    request = (async () => {
+      const entry = (await loadManifest()).artifacts[name];
+      if (!entry) {
+        throw new Error(`Unknown data artifact: ${name}`);
+      }
+
+      let lastError: unknown;
+      for (const path of candidatePaths(entry)) {
+        try {
+          const data = await fetchJson<unknown>(`${DATA_URL}${path}`);
+          return { name, hash: entry.hash, data };
+        } catch (error) {
+          lastError = error;
+        }
+      }
+      throw lastError;
+    })();
+    request.catch(() => {
+      artifactRequests.delete(name);
+    });
+    artifactRequests.set(name, request);
+  }
+  return request as Promise<LoadedArtifact<T>>;
+};
+
+/**
+ * Load an artifact from a component; pass null to load nothing yet
+ * Returns null until it arrives, or while a different name is loading
+ */
+export const useDataArtifact = <T>(
+  name: string | null
+): { artifact: LoadedArtifact<T> | null; error: string | null } => {
+  const [artifact, setArtifact] = useState<LoadedArtifact<T> | null>(null);
+  const [error, setError] = useState<{ name: string; message: string } | null>(null);
+
+  useEffect(() => {
+    if (name === null) return;
+    let cancelled = false;
+    loadArtifact<T>(name).then(
+      (loaded) => {
+        if (!cancelled) setArtifact(loaded);
+      },
+      (reason: unknown) => {
+        if (!cancelled) setError({ name, message: reason instanceof Error ? reason.message : String(reason) });
+      }
+    );
+    return () => {
+      cancelled = true;
+    };
+  }, [name]);
+
+  return {
+    artifact: artifact?.name === name ? artifact : null,
+    error: error?.name === name ? error.message : null,
+  };
+};
@@ -0,0 +1,173 @@
+/**
+ * Spaced-repetition scheduler for flashcard decks
+ * Review state lives in typed arrays indexed by card, and a binary min-heap
+ * ordered by due time picks the next card in O(log n).
+ * Scheduler functions mutate the state in place so large decks avoid copies.
+ */
+
+export type ReviewGrade = 'again' | 'hard' | 'good' | 'easy';
+
+export type ReviewState = {
+  readonly due: Float64Array; // ms timestamp the card is next due
+  readonly interval: Float32Array; // days until the next review
+  readonly ease: Uint16Array; // ease factor × 1000 (SM-2)
+  readonly reps: Uint16Array; // successful reviews in a row
+  readonly heap: Int32Array; // card indices, earliest due first
+};
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const RELEARN_MS = 60 * 1000;
+const INITIAL_EASE = 2500;
+const MIN_EASE = 1300;
+const MAX_EASE = 4000;
+
+// Earlier due time first; ties keep deck order
+const before = (state: ReviewState, a: number, b: number): boolean => {
+  const dueA = state.due[a];
+  const dueB = state.due[b];
+  return dueA < dueB || (dueA === dueB && a < b);
+};
+
+const siftDown = (state: ReviewState, position: number): void => {
+  const { heap } = state;
+  const size = heap.length;
+  const card = heap[position];
+
+  for (;;) {
+    const left = 2 * position + 1;
+    if (left >= size) break;
+    const right = left + 1;
+    const child = right < size && before(state, heap[right], heap[left]) ? right : left;
+    if (!before(state, heap[child], card)) break;
+    heap[position] = heap[child];
+    position = child;
+  }
+  heap[position] = card;
+};
+
+// Order the whole heap by due time - O(n)
+const buildHeap = (state: ReviewState): void => {
+  for (let position = (state.heap.length >> 1) - 1; position >= 0; position--) {
+    siftDown(state, position);
+  }
+};
+
+const cardHeap = (cardCount: number): Int32Array => {
+  const heap = new Int32Array(cardCount);
+  for (let i = 0; i < cardCount; i++) {
+    heap[i] = i;
+  }
+  return heap;
+};
+
+/**
+ * Create review state for a deck of cardCount cards
+ * Every card starts due immediately, in deck order
+ */
+export const createReviewState = (cardCount: number): ReviewState => {
+  return {
+    due: new Float64Array(cardCount),
+    interval: new Float32Array(cardCount),
+    ease: new Uint16Array(cardCount).fill(INITIAL_EASE),
+    reps: new Uint16Array(cardCount),
+    heap: cardHeap(cardCount),
+  };
+};
+
+// Bytes per card when packed: due, interval, ease, reps
+const PACKED_CARD_BYTES = 8 + 4 + 2 + 2;
+
+/**
+ * Pack the per-card arrays into one buffer for storage (16 bytes per card)
+ * The heap is left out; unpackReviewState rebuilds it from the due times
+ */
+export const packReviewState = (state: ReviewState): Uint8Array => {
+  const n = state.due.length;
+  const packed = new Uint8Array(n * PACKED_CARD_BYTES);
+  // Largest element size first keeps every section aligned
+  packed.set(new Uint8Array(state.due.buffer, state.due.byteOffset, n * 8), 0);
+  packed.set(new Uint8Array(state.interval.buffer, state.interval.byteOffset, n * 4), n * 8);
+  packed.set(new Uint8Array(state.ease.buffer, state.ease.byteOffset, n * 2), n * 12);
+  packed.set(new Uint8Array(state.reps.buffer, state.reps.byteOffset, n * 2), n * 14);
+  return packed;
+};
+
+/**
+ * Restore state packed by packReviewState
+ * Returns null if the data doesn't match a deck of cardCount cards
+ */
+export const unpackReviewState = (packed: Uint8Array, cardCount: number): ReviewState | null => {
+  if (packed.length !== cardCount * PACKED_CARD_BYTES) return null;
+
+  // Copy so the typed arrays get their own aligned buffer
+  const buffer = packed.slice().buffer;
+  const n = cardCount;
+  const state: ReviewState = {
+    due: new Float64Array(buffer, 0, n),
+    interval: new Float32Array(buffer, n * 8, n),
+    ease: new Uint16Array(buffer, n * 12, n),
+    reps: new Uint16Array(buffer, n * 14, n),
+    heap: cardHeap(n),
+  };
+  buildHeap(state);
+  return state;
+};
+
+/**
+ * Index of the card with the earliest due time, or null for an empty deck
+ * The card may not be due yet; compare with isCardDue to review ahead
+ */
+export const peekNextCard = (state: ReviewState): number | null => {
+  return state.heap.length > 0 ? state.heap[0] : null;
+};
+
+/**
+ * Check whether a card is due at the given time
+ */
+export const isCardDue = (state: ReviewState, card: number, now: number): boolean => {
+  return state.due[card] <= now;
+};
+
+/**
+ * Grade the card at the front of the queue and reschedule it (SM-2)
+ * Mutates state in place - O(log n)
+ */
+export const reviewNextCard = (state: ReviewState, grade: ReviewGrade, now: number): void => {
+  const card = peekNextCard(state);
+  if (card === null) return;
+
+  const ease = state.ease[card];
+  const reps = state.reps[card];
+  const interval = state.interval[card];
+
+  if (grade === 'again') {
+    state.reps[card] = 0;
+    state.interval[card] = 0;
+    state.ease[card] = Math.max(MIN_EASE, ease - 200);
+    state.due[card] = now + RELEARN_MS;
+  } else {
+    let nextInterval: number;
+    if (reps === 0) {
+      nextInterval = 1;
+    } else if (reps === 1) {
+      nextInterval = 6;
+    } else {
+      nextInterval = interval * (ease / 1000);
+    }
+
+    if (grade === 'hard') {
+      nextInterval = Math.max(1, interval * 1.2);
+      state.ease[card] = Math.max(MIN_EASE, ease - 150);
+    } else if (grade === 'easy') {
+      nextInterval *= 1.3;
+      state.ease[card] = Math.min(MAX_EASE, ease + 150);
+    }
+
+    state.reps[card] = Math.min(reps + 1, 0xffff);
+    state.interval[card] = nextInterval;
+    state.due[card] = now + nextInterval * DAY_MS;
+  }
+
+  // The reviewed card is the heap root and only moved later in time
+  siftDown(state, 0);
+};